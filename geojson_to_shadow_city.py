@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import argparse
+import logging
 import sys
 from lib.converter import EnhancedCityConverter
+from lib.feature_processor.feature_processor import MIN_POOL_JOBS, MIN_POOL_FEATURES
 from lib.preprocessor import GeoJSONPreprocessor
 from lib.preview.openscad_integration import OpenSCADIntegration
 
@@ -64,6 +66,16 @@ def main():
         help="Minimum building footprint area in m^2 (default: 600)",
     )
     parser.add_argument("--debug", action="store_true", help="Enable detailed debug output")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for feature processing, 0 for one per CPU (default: 1). "
+            f"Has no effect below {MIN_POOL_JOBS} workers or {MIN_POOL_FEATURES} "
+            "features; smaller runs are processed serially"
+        ),
+    )
 
     # Bridge parameters
     parser.add_argument(
@@ -104,6 +116,16 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive number of workers")
+
+    # Processor debug output goes through the logging module so that message
+    # formatting only happens when --debug is passed.
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
 
     try:
         # Prepare style settings; detailed logs are only enabled if --debug is passed.
@@ -121,7 +143,10 @@ def main():
 
         # Create the converter and explicitly set debug based on the flag.
         converter = EnhancedCityConverter(
-            size_mm=args.size, max_height_mm=args.height, style_settings=style_settings
+            size_mm=args.size,
+            max_height_mm=args.height,
+            style_settings=style_settings,
+            jobs=args.jobs or None,
         )
         converter.debug = args.debug  # When --debug is not passed, debug is False.
         converter.layer_specs["roads"]["width"] = args.road_width
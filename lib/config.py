@@ -1,4 +1,5 @@
 # lib/config.py
+from functools import lru_cache
 from typing import Dict, Any, List, Set
 
 class Config:
@@ -306,6 +307,34 @@ class Config:
     # -----------------------------------------------------------------------------
     # Class Methods for Helper Operations
     # -----------------------------------------------------------------------------
+    @staticmethod
+    def tag_value(properties: Dict[str, Any], key: str) -> str:
+        """Get a tag value lowercased, or '' when the tag is absent.
+        
+        OSM values are almost always lowercase already, so lower() (and the
+        new string it allocates) is skipped when it would be a no-op.
+        """
+        value = properties.get(key, '')
+        return value if value.islower() else value.lower()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_measurement(value: str, unit: str = '') -> float:
+        """Parse a numeric tag value such as '10', '10 m' or '10m'.
+        
+        Bare numbers, the usual case, are converted directly. Anything else
+        falls back to the first whitespace-separated token, with `unit`
+        characters stripped from its ends. Results are memoised, since the
+        same few height values recur across a whole extract.
+        
+        Raises:
+            ValueError, IndexError: If no number can be read
+        """
+        try:
+            return float(value)
+        except ValueError:
+            return float(value.split()[0].strip(unit))
+
     @classmethod
     def get_road_width(cls, road_type: str) -> float:
         """Get road width multiplier for a specific road type.
@@ -320,10 +349,9 @@ class Config:
         
         This multiplier influences how much taller an industrial building appears.
         """
-        return cls.INDUSTRIAL_SETTINGS['height_multipliers'].get(
-            building_type, 
-            cls.INDUSTRIAL_SETTINGS['height_multipliers']['industrial']
-        )
+        multipliers = cls.INDUSTRIAL_SETTINGS['height_multipliers']
+        multiplier = multipliers.get(building_type)
+        return multiplier if multiplier is not None else multipliers['industrial']
 
     @classmethod
     def is_industrial_feature(cls, properties: Dict[str, Any]) -> bool:
@@ -334,11 +362,11 @@ class Config:
         if not properties:
             return False
             
-        building = properties.get('building', '').lower()
+        building = cls.tag_value(properties, 'building')
         if building in cls.INDUSTRIAL_BUILDINGS:
             return True
             
-        landuse = properties.get('landuse', '').lower()
+        landuse = cls.tag_value(properties, 'landuse')
         if landuse in cls.INDUSTRIAL_LANDUSE:
             return True
             
@@ -351,6 +379,9 @@ class Config:
         Considers both 'landuse' and 'leisure' tags. Adjusting GREEN_LANDUSE or GREEN_LEISURE
         alters which features are rendered as parks or gardens.
         """
-        landuse = properties.get('landuse', '').lower()
-        leisure = properties.get('leisure', '').lower()
-        return landuse in cls.GREEN_LANDUSE or leisure in cls.GREEN_LEISURE
+        if 'landuse' not in properties and 'leisure' not in properties:
+            return False
+        return (
+            cls.tag_value(properties, 'landuse') in cls.GREEN_LANDUSE
+            or cls.tag_value(properties, 'leisure') in cls.GREEN_LEISURE
+        )
@@ -5,11 +5,11 @@ from .scad_generator import ScadGenerator
 from .style.style_manager import StyleManager
 
 class EnhancedCityConverter:
-    def __init__(self, size_mm=200, max_height_mm=20, style_settings=None):
+    def __init__(self, size_mm=200, max_height_mm=20, style_settings=None, jobs=1):
         self.size = size_mm
         self.max_height = max_height_mm
         self.style_manager = StyleManager(style_settings)
-        self.feature_processor = FeatureProcessor(self.style_manager)
+        self.feature_processor = FeatureProcessor(self.style_manager, jobs=jobs)
         self.scad_generator = ScadGenerator(self.style_manager)
         self.debug = True
         self.debug_log = []
@@ -1,27 +1,28 @@
 # lib/feature_processor/barrier_processor.py
-from shapely.geometry import LineString, Polygon
-from shapely.ops import unary_union
+import numpy as np
+import shapely
+from ..geometry import GeometryUtils
+
+_geometry = GeometryUtils()
 
 def create_barrier_union(roads, railways, water, road_buffer=2.0, railway_buffer=2.0):
     """Combine roads, railways, and water into one shapely geometry used as a 'barrier'."""
-    barrier_geoms = []
-
-    # Roads -> buffered lines
-    for road in roads:
-        line = LineString(road["coords"])
-        barrier_geoms.append(line.buffer(road_buffer))
-
-    # Railways -> buffered lines
-    for rail in railways:
-        line = LineString(rail["coords"])
-        barrier_geoms.append(line.buffer(railway_buffer))
+    # Roads and railways -> buffered lines, built and buffered in one batch each
+    lines = _geometry.create_linestrings(
+        [road["coords"] for road in roads] + [rail["coords"] for rail in railways]
+    )
+    distances = np.repeat([road_buffer, railway_buffer], [len(roads), len(railways)])
+    barrier_geoms = list(shapely.buffer(lines, distances))
 
     # Water -> polygons (no buffer)
     for wfeat in water:
-        poly = Polygon(wfeat["coords"])
+        poly = wfeat.get("polygon")
+        # WaterProcessor stores None when the ring could not form a polygon
+        if poly is None:
+            continue
         barrier_geoms.append(poly)
 
     if barrier_geoms:
-        return unary_union(barrier_geoms)
+        return shapely.union_all(np.asarray(barrier_geoms, dtype=object))
     else:
         return None
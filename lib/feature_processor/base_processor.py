@@ -1,4 +1,7 @@
 # lib/feature_processor/base_processor.py
+import logging
+
+logger = logging.getLogger(__name__)
 
 class BaseProcessor:
     """
@@ -9,13 +12,33 @@ class BaseProcessor:
         self.geometry = geometry_utils
         self.style_manager = style_manager
         self.debug = debug
+        # Fixed for the run. Layer specs are held by reference, so overrides
+        # applied to their sections after construction (e.g. road width) still apply.
+        self._layer_specs = style_manager.get_default_layer_specs()
+        self._artistic_style = style_manager.style.get("artistic_style")
+        self._min_building_area = style_manager.style.get("min_building_area", 600.0)
+    
+    def _transform_coords(self, coords, transform) -> list:
+        """
+        Project lon/lat coordinates into model space in one vectorized call.
+        
+        Args:
+            coords: List of [lon, lat] pairs
+            transform: CoordinateTransformer for the run
+            
+        Returns:
+            list: [x, y] pairs as Python lists
+        """
+        return transform.transform_array(coords).tolist()
         
-    def _log_debug(self, message: str) -> None:
+    def _log_debug(self, message: str, *args) -> None:
         """
         Wrapper for debug logging.
         
         Args:
-            message: Debug message to log
+            message: Debug message to log, using %-style placeholders
+            *args: Values for the placeholders; formatting is deferred to
+                the logging module and skipped when the record is filtered
         """
         if self.debug:
-            print(message)
\ No newline at end of file
+            logger.debug(message, *args)
\ No newline at end of file
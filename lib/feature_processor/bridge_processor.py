@@ -1,10 +1,11 @@
 # lib/feature_processor/bridge_processor.py
-from typing import Dict, Any, List, Optional, Tuple
-from shapely.geometry import LineString, Point, MultiLineString, MultiPolygon, Polygon
-from shapely.ops import linemerge, unary_union
+from typing import Dict, Any, List, Optional
+import numpy as np
+import shapely
+from shapely.geometry import LineString, Polygon
 from .base_processor import BaseProcessor
+from .linear_processor import _TRUTHY
 from ..config import Config
-from ..geometry import GeometryUtils
 
 class BridgeProcessor(BaseProcessor):
     """
@@ -14,16 +15,38 @@ class BridgeProcessor(BaseProcessor):
     providing consistent treatment for various bridge structures.
     """
     
+    BRIDGE_KEY = Config.FEATURE_TYPES['BRIDGE']
+    HIGHWAY_KEY = Config.FEATURE_TYPES['HIGHWAY']
+    RAILWAY_KEY = Config.FEATURE_TYPES['RAILWAY']
+    # bridge_type -> (tag holding the feature type, default feature type)
+    TYPE_KEYS = {
+        "road": (HIGHWAY_KEY, "bridge"),
+        "rail": (RAILWAY_KEY, "rail_bridge"),
+    }
+    
     def __init__(self, geometry_utils, style_manager, debug=False):
         super().__init__(geometry_utils, style_manager, debug)
-        self.geometry = geometry_utils
+        # Bridge settings are fixed for a run, so resolve them once
+        self._bridge_specs = self._layer_specs['bridges']
+        self._assumed_width = self._bridge_specs['assumed_width']
+        self._support_widths = {
+            bridge_type: self._get_support_width(self._bridge_specs, bridge_type)
+            for bridge_type in ("road", "rail")
+        }
+        # Spatial index over water polygons, rebuilt when the water bucket changes
+        self._water_tree = None
+        self._water_polys = None
+        self._water_bounds = None  # (minx, miny, maxx, maxy) of all indexed water
+        self._water_sig = None
+        self._water_source = None  # keeps the list alive so its id() can't be reused
     
     def process_bridge(
         self, 
         feature: Dict[str, Any], 
         features: Dict[str, list], 
         transform,
-        bridge_type: str = "road"
+        bridge_type: str = "road",
+        transformed: Optional[List[List[float]]] = None
     ) -> None:
         """
         Process a bridge feature with type-specific settings.
@@ -33,6 +56,8 @@ class BridgeProcessor(BaseProcessor):
             features: Dictionary of feature collections to update
             transform: Coordinate transformation function
             bridge_type: Type of bridge ("road" or "rail")
+            transformed: Model-space coords the caller already computed for
+                this feature; extracted and transformed here when omitted
         """
         props = feature.get("properties", {})
         
@@ -40,41 +65,48 @@ class BridgeProcessor(BaseProcessor):
         if not self._is_bridge(props):
             return
             
-        coords = self.geometry.extract_coordinates(feature)
-        if not coords or len(coords) < 2:
+        if transformed is None:
+            coords = self.geometry.extract_coordinates(feature)
+            if not coords:
+                return
+            transformed = self._transform_coords(coords, transform)
+        if len(transformed) < 2:
             return
-            
-        transformed = [transform(lon, lat) for lon, lat in coords]
         
-        # Get bridge settings from Config
-        bridge_specs = self.style_manager.get_default_layer_specs()['bridges']
+        bridge_specs = self._bridge_specs
+        # One geometry serves both the area estimate and the water test
+        bridge_line = LineString(transformed)
         
         # Calculate bridge area and minimum size
-        bridge_area = self._calculate_bridge_area(transformed, bridge_type)
+        bridge_area = self._calculate_bridge_area(bridge_line, bridge_type)
         min_bridge_size = bridge_specs['min_size']
         
         # Only process if it meets the minimum size requirement
         if bridge_area >= min_bridge_size:
             # Determine if bridge crosses water
-            crosses_water = self._check_water_crossing(transformed, features.get("water", []))
+            crosses_water = self._check_water_crossing(bridge_line, features.get("water", []))
+            feat_type = self._get_bridge_feature_type(props, bridge_type)
+            support_width = self._support_widths[bridge_type]
             
             # Store bridge data
             features["bridges"].append({
                 "coords": transformed,
-                "type": self._get_bridge_feature_type(props, bridge_type),
+                "type": feat_type,
                 "bridge_type": bridge_type,
                 "height": bridge_specs['height'],
                 "thickness": bridge_specs['thickness'],
-                "support_width": self._get_support_width(bridge_specs, bridge_type),
+                "support_width": support_width,
                 "crosses_water": crosses_water,
                 # Include railing flag for railway bridges
                 "needs_railings": bridge_type == "rail"
             })
             
             self._log_debug(
-                f"Added {bridge_type} bridge with area {bridge_area:.1f}m² " +
-                f"and feature type '{self._get_bridge_feature_type(props, bridge_type)}'" +
-                (", crossing water" if crosses_water else "")
+                "Added %s bridge with area %.1fm² and feature type '%s'%s",
+                bridge_type,
+                bridge_area,
+                feat_type,
+                ", crossing water" if crosses_water else ""
             )
     
     def _is_bridge(self, props: Dict[str, Any]) -> bool:
@@ -87,8 +119,9 @@ class BridgeProcessor(BaseProcessor):
         Returns:
             bool: True if the feature is a bridge
         """
-        bridge_value = props.get(Config.FEATURE_TYPES['BRIDGE'])
-        return bridge_value in ["yes", "true", "1", True]
+        bridge_value = props.get(self.BRIDGE_KEY)
+        # == rather than `is`: integer 1 counts as True, as it always has
+        return bridge_value == True or bridge_value in _TRUTHY  # noqa: E712
     
     def _get_bridge_feature_type(self, props: Dict[str, Any], bridge_type: str) -> str:
         """
@@ -101,34 +134,27 @@ class BridgeProcessor(BaseProcessor):
         Returns:
             str: Specific feature type
         """
-        if bridge_type == "road":
-            return props.get(Config.FEATURE_TYPES['HIGHWAY'], "bridge")
-        elif bridge_type == "rail":
-            return props.get(Config.FEATURE_TYPES['RAILWAY'], "rail_bridge")
-        else:
+        type_key = self.TYPE_KEYS.get(bridge_type)
+        if type_key is None:
             return "bridge"
+        return props.get(*type_key)
     
-    def _calculate_bridge_area(self, coords: List[List[float]], bridge_type: str) -> float:
+    def _calculate_bridge_area(self, bridge_line: LineString, bridge_type: str) -> float:
         """
-        Calculate the approximate area of a bridge based on its coordinates.
+        Calculate the approximate area of a bridge based on its centerline.
         
         Args:
-            coords: List of coordinate pairs
+            bridge_line: Bridge centerline in model coordinates
             bridge_type: Type of bridge ("road" or "rail")
             
         Returns:
             float: Approximate area in square meters
         """
-        if len(coords) < 2:
-            return 0.0
-            
-        # Calculate the length of the bridge (distance between first and last point)
-        line = LineString(coords)
-        length = line.length
+        # Calculate the length of the bridge along its centerline
+        length = bridge_line.length
         
         # Calculate the width using bridge-type-specific width from Config
-        bridge_specs = self.style_manager.get_default_layer_specs()['bridges']
-        width = bridge_specs['assumed_width'][bridge_type]
+        width = self._assumed_width[bridge_type]
         
         # Approximate area as length * width
         return length * width
@@ -151,12 +177,12 @@ class BridgeProcessor(BaseProcessor):
             # Fall back to using support_width directly if it's not a dict
             return float(bridge_specs['support_width'])
     
-    def _check_water_crossing(self, coords: List[List[float]], water_features: List[Dict[str, Any]]) -> bool:
+    def _check_water_crossing(self, bridge_line: LineString, water_features: List[Dict[str, Any]]) -> bool:
         """
         Check if bridge crosses any water features.
         
         Args:
-            coords: Bridge coordinates
+            bridge_line: Bridge centerline in model coordinates
             water_features: List of water features
             
         Returns:
@@ -166,20 +192,45 @@ class BridgeProcessor(BaseProcessor):
             return False
             
         try:
-            bridge_line = LineString(coords)
-            
-            for water in water_features:
-                water_coords = water.get("coords", [])
-                if len(water_coords) >= 3:
-                    water_poly = Polygon(water_coords)
-                    if bridge_line.intersects(water_poly):
-                        return True
-            
-            return False
+            water_tree = self._get_water_tree(water_features)
+            # Cheap rejection for bridges entirely outside the water extent
+            bx0, by0, bx1, by1 = bridge_line.bounds
+            wx0, wy0, wx1, wy1 = self._water_bounds
+            if bx0 > wx1 or bx1 < wx0 or by0 > wy1 or by1 < wy0:
+                return False
+            hits = water_tree.query(bridge_line, predicate="intersects")
+            return len(hits) > 0
         except Exception as e:
-            self._log_debug(f"Error checking water crossing: {str(e)}")
+            self._log_debug("Error checking water crossing: %s", e)
             return False
     
+    def _get_water_tree(self, water_features: List[Dict[str, Any]]) -> shapely.STRtree:
+        """
+        Get the STRtree over water polygons, building it only when the water
+        list differs from the one the cached tree was built from.
+        
+        Args:
+            water_features: List of water features
+            
+        Returns:
+            shapely.STRtree: Index over the water polygons
+        """
+        sig = (id(water_features), len(water_features))
+        if sig != self._water_sig:
+            self._water_polys = [
+                water["polygon"] for water in water_features
+                if water.get("polygon") is not None
+            ]
+            self._water_tree = shapely.STRtree(self._water_polys)
+            if len(self._water_polys):
+                self._water_bounds = tuple(shapely.total_bounds(self._water_polys).tolist())
+            else:
+                # Inverted extent rejects every bridge
+                self._water_bounds = (np.inf, np.inf, -np.inf, -np.inf)
+            self._water_sig = sig
+            self._water_source = water_features
+        return self._water_tree
+    
     def detect_implicit_bridges(self, features: Dict[str, list]) -> None:
         """
         Detect bridges that aren't explicitly tagged by finding road/rail crossings over water.
@@ -194,17 +245,22 @@ class BridgeProcessor(BaseProcessor):
         water_union = self._create_water_union(features["water"])
         if not water_union:
             return
+        # Build GEOS' internal index once; it is reused by every intersects test
+        shapely.prepare(water_union)
+        # The boundary is a fresh GEOS computation each time it is accessed
+        water_boundary = water_union.boundary
         
         # Process road intersections with water
-        self._detect_implicit_bridges_by_type(features, water_union, "roads", "road")
+        self._detect_implicit_bridges_by_type(features, water_union, water_boundary, "roads", "road")
         
         # Process railway intersections with water
-        self._detect_implicit_bridges_by_type(features, water_union, "railways", "rail")
+        self._detect_implicit_bridges_by_type(features, water_union, water_boundary, "railways", "rail")
     
     def _detect_implicit_bridges_by_type(
         self, 
         features: Dict[str, list], 
         water_union: Polygon, 
+        water_boundary,
         feature_type: str, 
         bridge_type: str
     ) -> None:
@@ -214,48 +270,56 @@ class BridgeProcessor(BaseProcessor):
         Args:
             features: Dictionary of feature collections
             water_union: Union of all water polygons
+            water_boundary: Boundary of water_union
             feature_type: Type of feature ("roads" or "railways")
             bridge_type: Type of bridge ("road" or "rail")
         """
-        bridge_specs = self.style_manager.get_default_layer_specs()['bridges']
+        bridge_specs = self._bridge_specs
+        support_width = self._support_widths[bridge_type]
         added_count = 0
         
-        for feature in features.get(feature_type, []):
-            # Skip if already processed as a bridge
-            if feature.get("bridge"):
-                continue
-                
-            coords = feature.get("coords", [])
-            if len(coords) < 2:
-                continue
-                
-            line = LineString(coords)
-            if line.intersects(water_union):
-                # Get intersection points
-                intersection = line.intersection(water_union.boundary)
+        # Skip features already processed as bridges. Road and railway records
+        # always carry at least two transformed coords, so no length check.
+        candidates = [
+            feature for feature in features.get(feature_type, [])
+            if not feature.get("bridge")
+        ]
+        if not candidates:
+            return
+        
+        # Test every candidate line against the water in one vectorized call
+        lines = self.geometry.create_linestrings([f["coords"] for f in candidates])
+        crossing = shapely.intersects(lines, water_union)
+        
+        for idx in np.flatnonzero(crossing):
+            feature = candidates[idx]
+            line = lines[idx]
+            
+            # Get intersection points
+            intersection = line.intersection(water_boundary)
+            
+            # Handle different intersection types
+            if intersection.geom_type == 'MultiPoint' and len(intersection.geoms) >= 2:
+                # Find the segment of the line that crosses water
+                bridge_segment = self._extract_bridge_segment(line, intersection, water_union)
                 
-                # Handle different intersection types
-                if intersection.geom_type == 'MultiPoint' and len(intersection.geoms) >= 2:
-                    # Find the segment of the line that crosses water
-                    bridge_segment = self._extract_bridge_segment(line, intersection, water_union)
-                    
-                    if bridge_segment and len(bridge_segment.coords) >= 2:
-                        # Add as implicit bridge
-                        features["bridges"].append({
-                            "coords": list(bridge_segment.coords),
-                            "type": feature.get("type", "unknown"),
-                            "bridge_type": bridge_type,
-                            "height": bridge_specs['height'],
-                            "thickness": bridge_specs['thickness'],
-                            "support_width": self._get_support_width(bridge_specs, bridge_type),
-                            "crosses_water": True,
-                            "is_implicit": True,
-                            "needs_railings": bridge_type == "rail"
-                        })
-                        added_count += 1
+                if bridge_segment and len(bridge_segment.coords) >= 2:
+                    # Add as implicit bridge
+                    features["bridges"].append({
+                        "coords": list(bridge_segment.coords),
+                        "type": feature.get("type", "unknown"),
+                        "bridge_type": bridge_type,
+                        "height": bridge_specs['height'],
+                        "thickness": bridge_specs['thickness'],
+                        "support_width": support_width,
+                        "crosses_water": True,
+                        "is_implicit": True,
+                        "needs_railings": bridge_type == "rail"
+                    })
+                    added_count += 1
         
         if added_count > 0:
-            self._log_debug(f"Added {added_count} implicit {bridge_type} bridges over water")
+            self._log_debug("Added %d implicit %s bridges over water", added_count, bridge_type)
     
     def _create_water_union(self, water_features: List[Dict[str, Any]]) -> Optional[Polygon]:
         """
@@ -267,25 +331,19 @@ class BridgeProcessor(BaseProcessor):
         Returns:
             Optional[Polygon]: Union of water polygons, or None if no valid water
         """
-        water_polys = []
-        
-        for water in water_features:
-            coords = water.get("coords", [])
-            if len(coords) >= 3:
-                try:
-                    poly = Polygon(coords)
-                    if poly.is_valid and not poly.is_empty:
-                        water_polys.append(poly)
-                except Exception:
-                    continue
+        water_polys = np.asarray(
+            [water.get("polygon") for water in water_features], dtype=object
+        )
+        # Missing polygons are None, which is neither valid nor empty
+        water_polys = water_polys[shapely.is_valid(water_polys) & ~shapely.is_empty(water_polys)]
         
-        if not water_polys:
+        if not len(water_polys):
             return None
             
         try:
-            return unary_union(water_polys)
+            return shapely.union_all(water_polys)
         except Exception as e:
-            self._log_debug(f"Error creating water union: {str(e)}")
+            self._log_debug("Error creating water union: %s", e)
             return None
     
     def _extract_bridge_segment(self, line: LineString, intersection, water_union: Polygon) -> Optional[LineString]:
@@ -306,36 +364,27 @@ class BridgeProcessor(BaseProcessor):
                 # Single point intersection - not a crossing
                 return None
             elif intersection.geom_type == 'MultiPoint':
-                # Find closest pair of points that define a crossing
-                points = list(intersection.geoms)
+                points = shapely.get_parts(intersection)
                 if len(points) < 2:
                     return None
                     
-                # Split the line at intersection points
-                distances = [line.project(p) for p in points]
-                segments = []
+                # Order the intersection points along the line
+                distances = shapely.line_locate_point(line, points)
+                order = np.argsort(distances, kind="stable")
+                xy = shapely.get_coordinates(points[order])
                 
-                # Sort distances
-                sorted_points = sorted(zip(distances, points), key=lambda x: x[0])
-                
-                # Check consecutive pairs for valid crossings
-                for i in range(len(sorted_points) - 1):
-                    d1, p1 = sorted_points[i]
-                    d2, p2 = sorted_points[i + 1]
-                    
-                    # Create segment between these points
-                    mid_point = LineString([p1, p2]).interpolate(0.5, normalized=True)
-                    
-                    # If the midpoint is inside the water, this is a valid crossing
-                    if water_union.contains(mid_point):
-                        segment = LineString([p1, p2])
-                        segments.append(segment)
+                # A consecutive pair is a crossing if its midpoint is inside the water
+                midpoints = 0.5 * (xy[:-1] + xy[1:])
+                inside = np.flatnonzero(
+                    shapely.contains_xy(water_union, midpoints[:, 0], midpoints[:, 1])
+                )
                 
                 # If we found at least one segment, return the first one
-                if segments:
-                    return segments[0]
+                if inside.size:
+                    i = inside[0]
+                    return LineString(xy[i:i + 2])
             
             return None
         except Exception as e:
-            self._log_debug(f"Error extracting bridge segment: {str(e)}")
+            self._log_debug("Error extracting bridge segment: %s", e)
             return None
\ No newline at end of file
@@ -1,4 +1,5 @@
 # lib/feature_processor/building_processor.py
+from itertools import chain
 from shapely.geometry import Polygon
 from .base_processor import BaseProcessor
 
@@ -13,18 +14,51 @@ class BuildingProcessor(BaseProcessor):
             return
 
         area_m2 = self.geometry.approximate_polygon_area_m2(coords)
-        min_area = self.style_manager.style.get("min_building_area", 600.0)
+        min_area = self._min_building_area
 
         # Only skip small buildings if not using block-combine style.
         #if (self.style_manager.style.get("artistic_style") != "block-combine") and (area_m2 < min_area):
         if area_m2 < min_area:
-            if self.debug:
-                print(f"Skipping small building with area {area_m2:.1f}m²")
+            self._log_debug("Skipping small building with area %.1fm²", area_m2)
             return
 
-        transformed = [transform(lon, lat) for lon, lat in coords]
+        transformed = self._transform_coords(coords, transform)
         height = self.style_manager.scale_building_height(props)
 
         features["buildings"].append({"coords": transformed, "height": height})
-        if self.debug:
-            print(f"Added building with height {height:.1f}mm and area {area_m2:.1f}m²")
+        self._log_debug("Added building with height %.1fmm and area %.1fm²", height, area_m2)
+
+    def process_batch(self, feature_list, features, transform):
+        """
+        Process many regular buildings at once.
+
+        The buildings that pass the area filter are transformed in a single
+        call. The result matches calling process_building on each feature in
+        order.
+        """
+        min_area = self._min_building_area
+        kept = []
+        for feature in feature_list:
+            coords = self.geometry.extract_coordinates(feature)
+            if not coords:
+                continue
+            area_m2 = self.geometry.approximate_polygon_area_m2(coords)
+            # Skip footprints below the minimum building area
+            if area_m2 < min_area:
+                self._log_debug("Skipping small building with area %.1fm²", area_m2)
+            else:
+                kept.append((feature, coords, area_m2))
+        if not kept:
+            return
+
+        transformed = self._transform_coords(
+            list(chain.from_iterable(coords for _, coords, _ in kept)), transform
+        )
+        buildings = features["buildings"]
+        start = 0
+        for feature, coords, area_m2 in kept:
+            end = start + len(coords)
+            height = self.style_manager.scale_building_height(feature.get("properties", {}))
+            buildings.append({"coords": transformed[start:end], "height": height})
+            self._log_debug("Added building with height %.1fmm and area %.1fm²", height, area_m2)
+            start = end
@@ -1,5 +1,11 @@
 # file: lib/feature_processor/feature_processor.py
 
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
 from shapely.geometry import box
 from .building_processor import BuildingProcessor
 from .industrial_processor import IndustrialProcessor
@@ -11,21 +17,206 @@ from .park_processor import ParkProcessor
 from .bridge_processor import BridgeProcessor
 from ..geometry import GeometryUtils
 
+logger = logging.getLogger(__name__)
+
+# Output buckets filled by process_features, in reporting order
+FEATURE_CATEGORIES = (
+    "water",
+    "roads",
+    "railways",
+    "buildings",
+    "bridges",
+    "industrial",
+    "parks",
+)
+
+# When the first pass goes to the process pool. The parent pickles every
+# chunk, unpickles every result and runs the water prepass itself, about
+# 14 us per feature, while the processing it hands out costs about 19 us per
+# feature. With jobs workers the pool takes 14 + 19 / jobs us per feature,
+# which only beats 19 us from about four workers. At six it saves roughly
+# 1.8 us per feature, and that has to cover spawning the workers (about
+# 0.4 s with the spawn start method), so it needs a quarter of a million
+# features to come out ahead.
+MIN_POOL_JOBS = 6
+MIN_POOL_FEATURES = 250000
+
+
+def _init_worker(log_queue, level):
+    """
+    Worker initializer: route log records to the parent's handlers.
+
+    Spawned workers start with an unconfigured logging module, and forked
+    ones would write through copies of the parent's handlers.
+
+    Args:
+        log_queue: Queue drained by a QueueListener in the parent
+        level: Root logger level of the parent
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _process_chunk(processor, chunk, water_prefix, transform):
+    """
+    Worker entry point for FeatureProcessor's parallel first pass.
+
+    Args:
+        processor: FeatureProcessor (pickled into the worker)
+        chunk: Contiguous slice of the input features
+        water_prefix: Water entries produced by features preceding the chunk
+        transform: CoordinateTransformer for the run
+
+    Returns:
+        dict: Buckets for this chunk, without the water prefix
+    """
+    features = {category: [] for category in FEATURE_CATEGORIES}
+    # Bridges test against the water seen so far, exactly as in a serial run
+    features["water"] = water_prefix
+    seen = len(water_prefix)
+    processor._dispatch_features(chunk, features, transform)
+    features["water"] = features["water"][seen:]
+    return features
+
 class FeatureProcessor:
-    def __init__(self, style_manager):
+    def __init__(self, style_manager, jobs=1):
+        """
+        Args:
+            style_manager: StyleManager for the run
+            jobs: Worker processes for the first pass; None uses every CPU
+        """
         self.style_manager = style_manager
+        self.jobs = jobs if jobs is not None else (os.cpu_count() or 1)
         self.geometry = GeometryUtils()  # uses the same GeometryUtils
-        self.debug = True  # set True for debug prints
+        # Follow the logging configuration (the CLI enables DEBUG for --debug)
+        self.debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Create a shared bridge processor that is used by both road and rail processors
+        self.bridge_proc = BridgeProcessor(self.geometry, style_manager, debug=self.debug)
 
         # Create sub-processor instances
         self.building_proc = BuildingProcessor(self.geometry, style_manager, debug=self.debug)
         self.industrial_proc = IndustrialProcessor(self.geometry, style_manager, debug=self.debug)
-        self.road_proc = RoadProcessor(self.geometry, style_manager, debug=self.debug)
-        self.rail_proc = RailwayProcessor(self.geometry, style_manager, debug=self.debug)
+        self.road_proc = RoadProcessor(
+            self.geometry, style_manager, debug=self.debug, bridge_processor=self.bridge_proc
+        )
+        self.rail_proc = RailwayProcessor(
+            self.geometry, style_manager, debug=self.debug, bridge_processor=self.bridge_proc
+        )
         self.water_proc = WaterProcessor(self.geometry, style_manager, debug=self.debug)
         self.park_proc = ParkProcessor(self.geometry, style_manager, debug=self.debug)
-        # Create a shared bridge processor that can be used by both road and rail processors
-        self.bridge_proc = BridgeProcessor(self.geometry, style_manager, debug=self.debug)
+
+        # Feature kind (see _classify_feature) -> handler(feature, features, transform)
+        self._dispatch = {
+            "industrial_building": self.industrial_proc.process_industrial_building,
+            "industrial_area": self.industrial_proc.process_industrial_area,
+            "water": self.water_proc.process_water,
+            "parking": self.road_proc.process_parking,
+            "road": self.road_proc.process_road_or_bridge,
+            "railway": self.rail_proc.process_railway,
+            "park": self.park_proc.process_park,
+        }
+        # Kinds collected during the pass and handed over as one batch:
+        # kind -> handler(feature_list, features, transform)
+        self._batch_dispatch = {
+            "building": self.building_proc.process_batch,
+        }
+
+    def _dispatch_features(self, feature_list, features, transform):
+        """
+        Run each feature through its handler, appending to features in order.
+
+        Args:
+            feature_list: GeoJSON features
+            features: Dictionary of feature collections to update
+            transform: Coordinate transformation function
+        """
+        dispatch = self._dispatch
+        batches = {kind: [] for kind in self._batch_dispatch}
+        for feature in feature_list:
+            kind = self._classify_feature(feature.get("properties", {}))
+            if kind in batches:
+                batches[kind].append(feature)
+            elif kind is not None:
+                dispatch[kind](feature, features, transform)
+
+        # Each batched kind owns its output bucket, so running it after the
+        # pass leaves every bucket in input order
+        for kind, batch in batches.items():
+            if batch:
+                self._batch_dispatch[kind](batch, features, transform)
+
+    def _dispatch_parallel(self, feature_list, features, transform, jobs):
+        """
+        Split the first pass over worker processes in contiguous chunks.
+
+        Partial buckets are concatenated in chunk order, so the result matches
+        _dispatch_features.
+
+        Args:
+            feature_list: GeoJSON features
+            features: Dictionary of feature collections to update
+            transform: Coordinate transformation function (must be picklable)
+            jobs: Number of worker processes
+        """
+        chunk_size = -(-len(feature_list) // jobs)
+        chunks = [feature_list[i:i + chunk_size] for i in range(0, len(feature_list), chunk_size)]
+
+        # Water is cheap to build, so collect what precedes each chunk up front.
+        # The workers log each water feature, so the prepass stays quiet.
+        water_proc = WaterProcessor(self.geometry, self.style_manager, debug=False)
+        seen = {"water": []}
+        water_prefixes = []
+        for chunk in chunks:
+            water_prefixes.append(list(seen["water"]))
+            for feature in chunk:
+                if self._classify_feature(feature.get("properties", {})) == "water":
+                    water_proc.process_water(feature, seen, transform)
+
+        root = logging.getLogger()
+        log_queue = multiprocessing.Queue()
+        listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker, initargs=(log_queue, root.level)
+            ) as executor:
+                parts = executor.map(_process_chunk, repeat(self), chunks, water_prefixes, repeat(transform))
+                for part in parts:
+                    for category, items in part.items():
+                        features[category].extend(items)
+        finally:
+            listener.stop()
+
+    def _classify_feature(self, props):
+        """
+        Decide which handler a feature belongs to.
+
+        Args:
+            props: Feature properties
+
+        Returns:
+            str: Key into self._dispatch or self._batch_dispatch, or None if
+            the feature is ignored
+        """
+        # Check for industrial features first
+        if self.industrial_proc.should_process_as_industrial(props):
+            return "industrial_building" if props.get("building") else "industrial_area"
+
+        if props.get("natural") == "water":
+            return "water"
+        if "building" in props:
+            return "building"
+        if self.road_proc.is_parking_area(props):
+            return "parking"
+        if "highway" in props:
+            return "road"
+        if "railway" in props:
+            return "railway"
+        if ("leisure" in props) or ("landuse" in props):
+            return "park"
+        return None
         
     def process_features(self, geojson_data, size):
         """
@@ -36,41 +227,14 @@ class FeatureProcessor:
         transform = self.geometry.create_coordinate_transformer(geojson_data["features"], size)
 
         # Initialize buckets
-        features = {
-            "water": [],
-            "roads": [],
-            "railways": [],
-            "buildings": [],
-            "bridges": [],
-            "industrial": [],
-            "parks": []
-        }
+        features = {category: [] for category in FEATURE_CATEGORIES}
 
-        # First pass: process all features
-        for feature in geojson_data["features"]:
-            props = feature.get("properties", {})
-
-            # Check for industrial features first
-            if self.industrial_proc.should_process_as_industrial(props):
-                if props.get("building"):
-                    self.industrial_proc.process_industrial_building(feature, features, transform)
-                else:
-                    self.industrial_proc.process_industrial_area(feature, features, transform)
-                continue
-
-            # Process other feature types...
-            if props.get("natural") == "water":
-                self.water_proc.process_water(feature, features, transform)
-            elif "building" in props:
-                self.building_proc.process_building(feature, features, transform)
-            elif self.road_proc.is_parking_area(props):
-                self.road_proc.process_parking(feature, features, transform)
-            elif "highway" in props:
-                self.road_proc.process_road_or_bridge(feature, features, transform)
-            elif "railway" in props:
-                self.rail_proc.process_railway(feature, features, transform)
-            elif ("leisure" in props) or ("landuse" in props):
-                self.park_proc.process_park(feature, features, transform)
+        # First pass: classify each feature once and dispatch to its handler
+        feature_list = geojson_data["features"]
+        if self.jobs >= MIN_POOL_JOBS and len(feature_list) >= MIN_POOL_FEATURES:
+            self._dispatch_parallel(feature_list, features, transform, self.jobs)
+        else:
+            self._dispatch_features(feature_list, features, transform)
 
         # Store features in style manager
         self.style_manager.set_current_features(features)
@@ -80,32 +244,35 @@ class FeatureProcessor:
 
         # Debug summary
         if self.debug:
-            print(f"\nProcessed feature counts:")
+            logger.debug("\nProcessed feature counts:")
             for cat, items in features.items():
-                print(f"  {cat}: {len(items)}")
+                logger.debug("  %s: %d", cat, len(items))
                 if cat == "industrial":
                     buildings = sum(1 for x in items if "building_type" in x)
                     areas = sum(1 for x in items if "landuse_type" in x)
-                    print(f"    - Industrial buildings: {buildings}")
-                    print(f"    - Industrial areas: {areas}")
+                    logger.debug("    - Industrial buildings: %d", buildings)
+                    logger.debug("    - Industrial areas: %d", areas)
                 elif cat == "bridges":
                     explicit = sum(1 for x in items if not x.get("is_implicit", False))
                     implicit = sum(1 for x in items if x.get("is_implicit", False))
-                    print(f"    - Explicit bridges: {explicit}")
-                    print(f"    - Implicit bridges (detected): {implicit}")
-
-        # Create barrier union and merge buildings
-        barrier_union = create_barrier_union(
-            roads=features["roads"],
-            railways=features["railways"],
-            water=features["water"],
-            road_buffer=1.0,
-            railway_buffer=1.0,
-        )
+                    logger.debug("    - Explicit bridges: %d", explicit)
+                    logger.debug("    - Implicit bridges (detected): %d", implicit)
+
+        # Create barrier union (only when the merge strategy reads it)
+        barrier_union = None
+        if self.style_manager.uses_barrier_union():
+            barrier_union = create_barrier_union(
+                roads=features["roads"],
+                railways=features["railways"],
+                water=features["water"],
+                road_buffer=1.0,
+                railway_buffer=1.0,
+            )
 
         # Merge buildings + industrial
-        all_buildings = features["buildings"] + features["industrial"]
-        merged_bldgs = self.style_manager.merge_nearby_buildings(all_buildings, barrier_union)
+        merged_bldgs = self.style_manager.merge_nearby_buildings(
+            features["buildings"], features["industrial"], barrier_union=barrier_union
+        )
         features["buildings"] = merged_bldgs
 
         return features
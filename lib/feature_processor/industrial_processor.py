@@ -1,6 +1,5 @@
 # lib/feature_processor/industrial_processor.py
 from typing import Dict, Any, Optional, List, Tuple
-from shapely.geometry import Polygon
 from .base_processor import BaseProcessor
 from ..config import Config
 
@@ -28,11 +27,11 @@ class IndustrialProcessor(BaseProcessor):
         min_area = Config.INDUSTRIAL_SETTINGS['min_area']
         
         # Skip small buildings unless using block-combine style
-        if (self.style_manager.style.get("artistic_style") != "block-combine") and (area_m2 < min_area):
-            self._log_debug(f"Skipping small industrial building with area {area_m2:.1f}m²")
+        if (self._artistic_style != "block-combine") and (area_m2 < min_area):
+            self._log_debug("Skipping small industrial building with area %.1fm²", area_m2)
             return
             
-        transformed = [transform(lon, lat) for lon, lat in coords]
+        transformed = self._transform_coords(coords, transform)
         height = self._calculate_industrial_height(props)
         
         features["industrial"].append({
@@ -42,7 +41,7 @@ class IndustrialProcessor(BaseProcessor):
             "building_type": props.get("building", "industrial")
         })
         
-        self._log_debug(f"Added industrial building, height {height:.1f}mm, area {area_m2:.1f}m²")
+        self._log_debug("Added industrial building, height %.1fmm, area %.1fm²", height, area_m2)
 
     def process_industrial_area(self, feature: Dict[str, Any], features: Dict[str, list], transform) -> None:
         """
@@ -59,18 +58,18 @@ class IndustrialProcessor(BaseProcessor):
             return
             
         # Verify industrial landuse type
-        landuse = props.get("landuse", "").lower()
+        landuse = Config.tag_value(props, "landuse")
         if landuse not in Config.INDUSTRIAL_LANDUSE:
             return
             
-        transformed = [transform(lon, lat) for lon, lat in coords]
         area_m2 = self.geometry.approximate_polygon_area_m2(coords)
         
         # Skip small areas unless using block-combine style
-        if (self.style_manager.style.get("artistic_style") != "block-combine") and (area_m2 < Config.INDUSTRIAL_SETTINGS['min_area']):
-            self._log_debug(f"Skipping small industrial area with area {area_m2:.1f}m²")
+        if (self._artistic_style != "block-combine") and (area_m2 < Config.INDUSTRIAL_SETTINGS['min_area']):
+            self._log_debug("Skipping small industrial area with area %.1fm²", area_m2)
             return
             
+        transformed = self._transform_coords(coords, transform)
         height = self._calculate_industrial_area_height(landuse)
         
         features["industrial"].append({
@@ -80,7 +79,7 @@ class IndustrialProcessor(BaseProcessor):
             "landuse_type": landuse
         })
         
-        self._log_debug(f"Added industrial area type '{landuse}' with height {height:.1f}mm")
+        self._log_debug("Added industrial area type '%s' with height %.1fmm", landuse, height)
 
     def should_process_as_industrial(self, properties: Dict[str, Any]) -> bool:
         """
@@ -107,16 +106,14 @@ class IndustrialProcessor(BaseProcessor):
         explicit_height = self._get_explicit_height(properties)
         if explicit_height is not None:
             # Apply industrial multiplier to explicit height
-            base_height = self.style_manager.scale_building_height({
-                "height": str(explicit_height)
-            })
+            base_height = self.style_manager.scale_building_height_m(explicit_height)
             return base_height * 1.1  # Bonus for industrial buildings
             
         # Use type-based height calculation
         building_type = properties.get("building", "industrial")
         multiplier = Config.get_industrial_height_multiplier(building_type)
         
-        layer_specs = self.style_manager.get_default_layer_specs()
+        layer_specs = self._layer_specs
         min_height = layer_specs["buildings"]["min_height"]
         max_height = layer_specs["buildings"]["max_height"]
         
@@ -134,7 +131,7 @@ class IndustrialProcessor(BaseProcessor):
         """
         multiplier = Config.get_industrial_height_multiplier(landuse_type)
         
-        layer_specs = self.style_manager.get_default_layer_specs()
+        layer_specs = self._layer_specs
         min_height = layer_specs["buildings"]["min_height"]
         max_height = layer_specs["buildings"]["max_height"]
         
@@ -150,10 +147,10 @@ class IndustrialProcessor(BaseProcessor):
         Returns:
             Optional[float]: Explicit height in meters if available
         """
-        if "height" in properties:
+        height = properties.get("height")
+        if height is not None:
             try:
-                height_str = properties["height"].split()[0]  # Handle "10 m" format
-                return float(height_str)
+                return Config.parse_measurement(height)  # Handle "10 m" format
             except (ValueError, IndexError):
                 pass
                 
@@ -164,14 +161,4 @@ class IndustrialProcessor(BaseProcessor):
             except ValueError:
                 pass
                 
-        return None
-
-    def _log_debug(self, message: str) -> None:
-        """
-        Wrapper for debug logging.
-        
-        Args:
-            message: Debug message to log
-        """
-        if self.debug:
-            print(message)
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -1,6 +1,5 @@
 # lib/feature_processor/park_processor.py
 from typing import Dict, Any, Optional
-from shapely.geometry import Polygon
 from .base_processor import BaseProcessor
 from ..config import Config
 
@@ -10,6 +9,9 @@ class ParkProcessor(BaseProcessor):
     Uses centralized configuration for consistent handling of leisure and landuse features.
     """
 
+    # Geometry types that can be rendered as a green space
+    POLYGON_TYPES = frozenset(("Polygon", "MultiPolygon"))
+
     def process_park(self, feature: Dict[str, Any], features: Dict[str, list], transform) -> None:
         """
         Process a park or green space feature, applying appropriate settings and transformations.
@@ -20,12 +22,15 @@ class ParkProcessor(BaseProcessor):
             transform: Coordinate transformation function
         """
         props = feature.get("properties", {})
-        geometry_type = feature["geometry"]["type"]
 
         # Skip if not a recognized green space type
         if not self._is_valid_green_space(props):
             return
 
+        # Only polygon geometries are rendered, so skip the rest before extracting
+        if feature["geometry"]["type"] not in self.POLYGON_TYPES:
+            return
+
         # Extract and validate coordinates
         coords = self.geometry.extract_coordinates(feature)
         if not coords or len(coords) < 3:
@@ -36,12 +41,10 @@ class ParkProcessor(BaseProcessor):
         min_area = Config.DEFAULT_LAYER_SPECS["parks"]["min_area"]
         
         if area_m2 < min_area:
-            self._log_debug(f"Skipping small green space with area {area_m2:.1f}m²")
+            self._log_debug("Skipping small green space with area %.1fm²", area_m2)
             return
 
-        # Process valid polygon geometries
-        if geometry_type in ["Polygon", "MultiPolygon"]:
-            self._process_green_space_polygon(coords, features, transform, props)
+        self._process_green_space_polygon(coords, features, transform, props)
 
     def _process_green_space_polygon(
         self, 
@@ -59,10 +62,10 @@ class ParkProcessor(BaseProcessor):
             transform: Coordinate transformation function
             props: Feature properties
         """
-        transformed = [transform(lon, lat) for lon, lat in coords]
+        transformed = self._transform_coords(coords, transform)
         
         # Get park specifications from config
-        park_specs = self.style_manager.get_default_layer_specs()["parks"]
+        park_specs = self._layer_specs["parks"]
         
         feature_data = {
             "coords": transformed,
@@ -74,7 +77,7 @@ class ParkProcessor(BaseProcessor):
         features["parks"].append(feature_data)
         
         self._log_debug(
-            f"Added {feature_data['type']} green space with {len(transformed)} points"
+            "Added %s green space with %d points", feature_data['type'], len(transformed)
         )
 
     def _is_valid_green_space(self, props: Dict[str, Any]) -> bool:
@@ -100,12 +103,12 @@ class ParkProcessor(BaseProcessor):
             str: Specific type of green space
         """
         # Check landuse first
-        landuse = props.get("landuse", "").lower()
+        landuse = Config.tag_value(props, "landuse")
         if landuse in Config.GREEN_LANDUSE:
             return landuse
 
         # Check leisure second
-        leisure = props.get("leisure", "").lower()
+        leisure = Config.tag_value(props, "leisure")
         if leisure in Config.GREEN_LEISURE:
             return leisure
 
@@ -122,7 +125,7 @@ class ParkProcessor(BaseProcessor):
         Returns:
             float: Height in mm for the green space
         """
-        park_specs = self.style_manager.get_default_layer_specs()["parks"]
+        park_specs = self._layer_specs["parks"]
         
         # Could extend this with type-specific heights in the future
         return park_specs["thickness"]
@@ -138,14 +141,4 @@ class ParkProcessor(BaseProcessor):
             bool: True if additional features should be added
         """
         # Could be extended to add trees, benches, etc. based on type
-        return green_space_type in {"park", "garden", "recreation_ground"}
-
-    def _log_debug(self, message: str) -> None:
-        """
-        Wrapper for debug logging.
-        
-        Args:
-            message: Debug message to log
-        """
-        if self.debug:
-            print(message)
\ No newline at end of file
+        return green_space_type in {"park", "garden", "recreation_ground"}
\ No newline at end of file
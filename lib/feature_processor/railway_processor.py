@@ -12,10 +12,18 @@ class RailwayProcessor(LinearFeatureProcessor):
     
     FEATURE_TYPE = Config.FEATURE_TYPES['RAILWAY']
     feature_category = 'railways'
+    # Properties copied onto each railway record when present
+    EXTRA_TAGS = ("service", "bridge")
 
-    def __init__(self, geometry_utils, style_manager, debug=False):
+    def __init__(self, geometry_utils, style_manager, debug=False, bridge_processor=None):
+        """
+        Args:
+            bridge_processor: BridgeProcessor to share; a new one is created if None
+        """
         super().__init__(geometry_utils, style_manager, debug)
-        self.bridge_processor = BridgeProcessor(geometry_utils, style_manager, debug)
+        if bridge_processor is None:
+            bridge_processor = BridgeProcessor(geometry_utils, style_manager, debug)
+        self.bridge_processor = bridge_processor
 
     def process_railway(self, feature: Dict[str, Any], features: Dict[str, list], transform) -> None:
         """
@@ -28,22 +36,20 @@ class RailwayProcessor(LinearFeatureProcessor):
         """
         props = feature.get("properties", {})
         
-        # Get railway specifications from config
-        railway_specs = self.style_manager.get_default_layer_specs()['railways']
-        
+        # Skip tunnels before any coordinate work
+        if self._is_tunnel(props):
+            self._log_debug("Skipping tunnel %s: %s", self.FEATURE_TYPE, props.get(self.FEATURE_TYPE))
+            return
+
         # Process the feature as a railway
         coords = self.geometry.extract_coordinates(feature)
-        if not coords:
+        if len(coords) < 2:
             return
 
-        # Skip tunnels
-        if self._is_tunnel(props):
-            self._log_debug(f"Skipping tunnel {self.FEATURE_TYPE}: {props.get(self.FEATURE_TYPE)}")
-            return
-            
-        transformed = [transform(lon, lat) for lon, lat in coords]
-        if len(transformed) < 2:
-            return
+        transformed = self._transform_coords(coords, transform)
+
+        # Get railway specifications from config
+        railway_specs = self._layer_specs['railways']
 
         # Create railway feature with width
         feature_data = {
@@ -52,9 +58,8 @@ class RailwayProcessor(LinearFeatureProcessor):
             "width": railway_specs['width']
         }
 
-        # Add service tag if present
-        additional_tags = ["service", "bridge"]
-        for tag in additional_tags:
+        # Add service and bridge tags if present
+        for tag in self.EXTRA_TAGS:
             if tag in props:
                 feature_data[tag] = props[tag]
 
@@ -62,7 +67,7 @@ class RailwayProcessor(LinearFeatureProcessor):
         features[self.feature_category].append(feature_data)
         
         self._log_debug(
-            f"Added {self.FEATURE_TYPE} '{feature_data['type']}' with width {feature_data['width']:.1f}mm"
+            "Added %s '%s' with width %.1fmm", self.FEATURE_TYPE, feature_data['type'], feature_data['width']
         )
         
         # Special bridge handling
@@ -72,5 +77,6 @@ class RailwayProcessor(LinearFeatureProcessor):
                 feature, 
                 features, 
                 transform, 
-                bridge_type="rail"
+                bridge_type="rail",
+                transformed=transformed
             )
\ No newline at end of file
@@ -1,9 +1,8 @@
 # lib/feature_processor/road_processor.py
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from shapely.geometry import LineString, Polygon
 from .linear_processor import LinearFeatureProcessor
 from ..config import Config
-from ..geometry import GeometryUtils
 from .bridge_processor import BridgeProcessor
 
 class RoadProcessor(LinearFeatureProcessor):
@@ -14,10 +13,22 @@ class RoadProcessor(LinearFeatureProcessor):
     
     FEATURE_TYPE = Config.FEATURE_TYPES['HIGHWAY']
     feature_category = 'roads'
+    # Tags checked by is_parking_area and the values that mark parking
+    PARKING_KEYS = (Config.FEATURE_TYPES['AMENITY'], "parking", "service")
+    PARKING_VALUES = frozenset(("parking", "surface", "parking_aisle"))
     
-    def __init__(self, geometry_utils, style_manager, debug=False):
+    def __init__(self, geometry_utils, style_manager, debug=False, bridge_processor=None):
+        """
+        Args:
+            bridge_processor: BridgeProcessor to share; a new one is created if None
+        """
         super().__init__(geometry_utils, style_manager, debug)
-        self.bridge_processor = BridgeProcessor(geometry_utils, style_manager, debug)
+        # Held by reference: the CLI may override the base width after construction
+        self._road_specs = self._layer_specs['roads']
+        self._road_width_types = self._road_specs['types']
+        if bridge_processor is None:
+            bridge_processor = BridgeProcessor(geometry_utils, style_manager, debug)
+        self.bridge_processor = bridge_processor
 
     def process_road_or_bridge(self, feature: Dict[str, Any], features: Dict[str, list], transform) -> None:
         """
@@ -29,31 +40,28 @@ class RoadProcessor(LinearFeatureProcessor):
             transform: Coordinate transformation function
         """
         props = feature.get("properties", {})
-        road_type = props.get(self.FEATURE_TYPE)
-        
-        # Calculate actual road width based on road type
-        base_width = self.style_manager.get_default_layer_specs()['roads']['width']
-        type_multiplier = Config.get_road_width(road_type)
-        actual_width = base_width * type_multiplier
+        # Looked up once and reused for the width, the record and logging
+        road_type = props.get(self.FEATURE_TYPE, "unknown")
         
+        # Skip tunnels before any coordinate work
+        if self._is_tunnel(props):
+            self._log_debug("Skipping tunnel %s: %s", self.FEATURE_TYPE, road_type)
+            return
+
         # Process road directly instead of calling process_linear_feature with incompatible parameters
         coords = self.geometry.extract_coordinates(feature)
-        if not coords:
+        if len(coords) < 2:
             return
 
-        # Skip tunnels
-        if self._is_tunnel(props):
-            self._log_debug(f"Skipping tunnel {self.FEATURE_TYPE}: {props.get(self.FEATURE_TYPE)}")
-            return
+        transformed = self._transform_coords(coords, transform)
 
-        transformed = [transform(lon, lat) for lon, lat in coords]
-        if len(transformed) < 2:
-            return
+        # Calculate actual road width based on road type
+        actual_width = self._road_specs['width'] * self._road_width_types.get(road_type, 1.0)
 
         # Create feature dictionary with width
         feature_data = {
             "coords": transformed,
-            "type": props.get(self.FEATURE_TYPE, "unknown"),
+            "type": road_type,
             "is_parking": False,
             "width": actual_width
         }
@@ -65,7 +73,8 @@ class RoadProcessor(LinearFeatureProcessor):
         features[self.feature_category].append(feature_data)
         
         self._log_debug(
-            f"Added {self.FEATURE_TYPE} '{feature_data['type']}' with width {feature_data['width']:.1f}mm, {len(transformed)} points"
+            "Added %s '%s' with width %.1fmm, %d points",
+            self.FEATURE_TYPE, road_type, actual_width, len(transformed)
         )
         
         # Special bridge handling if needed
@@ -75,7 +84,8 @@ class RoadProcessor(LinearFeatureProcessor):
                 feature, 
                 features, 
                 transform, 
-                bridge_type="road"
+                bridge_type="road",
+                transformed=transformed
             )
     def _process_linear_feature(
         self, 
@@ -83,7 +93,7 @@ class RoadProcessor(LinearFeatureProcessor):
         features: Dict[str, list],
         transform,
         width_override: Optional[float] = None,
-        additional_tags: Optional[List[str]] = None
+        additional_tags: Sequence[str] = ()
     ) -> None:
         """
         Enhanced linear feature processing with width override capability.
@@ -93,40 +103,38 @@ class RoadProcessor(LinearFeatureProcessor):
             features: Dictionary of feature collections to update
             transform: Coordinate transformation function
             width_override: Optional specific width to use
-            additional_tags: Optional additional properties to preserve
+            additional_tags: Additional properties to preserve
         """
         props = feature.get("properties", {})
-        coords = self.geometry.extract_coordinates(feature)
-        if not coords:
-            return
-
-        # Skip tunnels
+        # Skip tunnels before any coordinate work
         if self._is_tunnel(props):
-            self._log_debug(f"Skipping tunnel {self.FEATURE_TYPE}: {props.get(self.FEATURE_TYPE)}")
+            self._log_debug("Skipping tunnel %s: %s", self.FEATURE_TYPE, props.get(self.FEATURE_TYPE))
             return
 
-        transformed = [transform(lon, lat) for lon, lat in coords]
-        if len(transformed) < 2:
+        coords = self.geometry.extract_coordinates(feature)
+        if len(coords) < 2:
             return
 
+        transformed = self._transform_coords(coords, transform)
+
         # Create feature dictionary
         feature_data = {
             "coords": transformed,
             "type": props.get(self.FEATURE_TYPE, "unknown"),
             "is_parking": False,
-            "width": width_override or self.style_manager.get_default_layer_specs()['roads']['width']
+            "width": width_override if width_override is not None else self._road_specs['width']
         }
 
         # Preserve additional properties if specified
-        if additional_tags:
-            for tag in additional_tags:
-                if tag in props:
-                    feature_data[tag] = props[tag]
+        for tag in additional_tags:
+            if tag in props:
+                feature_data[tag] = props[tag]
 
         features[self.feature_category].append(feature_data)
         
         self._log_debug(
-            f"Added {self.FEATURE_TYPE} '{feature_data['type']}' with width {feature_data['width']:.1f}mm, {len(transformed)} points"
+            "Added %s '%s' with width %.1fmm, %d points",
+            self.FEATURE_TYPE, feature_data['type'], feature_data['width'], len(transformed)
         )
 
     def _process_bridge(
@@ -134,7 +142,8 @@ class RoadProcessor(LinearFeatureProcessor):
         feature: Dict[str, Any], 
         features: Dict[str, list], 
         transform,
-        props: Dict[str, Any]
+        props: Dict[str, Any],
+        transformed: Optional[List[List[float]]] = None
     ) -> None:
         """
         Handle bridge-specific processing with bridge settings from config.
@@ -144,21 +153,23 @@ class RoadProcessor(LinearFeatureProcessor):
             features: Dictionary of feature collections to update
             transform: Coordinate transformation function
             props: Feature properties
-        """
-        coords = self.geometry.extract_coordinates(feature)
-        if not coords:
-            return
-
-        transformed = [transform(lon, lat) for lon, lat in coords]
+            transformed: Model-space coords the caller already computed for
+                this feature; extracted and transformed here when omitted
+        """
+        if transformed is None:
+            coords = self.geometry.extract_coordinates(feature)
+            if not coords:
+                return
+            transformed = self._transform_coords(coords, transform)
         if len(transformed) >= 2:
             # Calculate bridge area
             bridge_area = self._calculate_bridge_area(transformed)
-            min_bridge_size = self.style_manager.get_default_layer_specs()['bridges']['min_size']
+            min_bridge_size = self._layer_specs['bridges']['min_size']
 
             # Only process as a bridge if it meets the minimum size requirement
             if bridge_area >= min_bridge_size:
                 # Get bridge settings from config
-                bridge_specs = self.style_manager.get_default_layer_specs()['bridges']
+                bridge_specs = self._layer_specs['bridges']
                 
                 features["bridges"].append({
                     "coords": transformed,
@@ -168,16 +179,15 @@ class RoadProcessor(LinearFeatureProcessor):
                     "support_width": bridge_specs['support_width']
                 })
                 
-                self._log_debug(f"Added bridge of type '{props.get(self.FEATURE_TYPE, 'bridge')}' with area {bridge_area:.1f}m²")
+                self._log_debug("Added bridge of type '%s' with area %.1fm²", props.get(self.FEATURE_TYPE, 'bridge'), bridge_area)
             else:
                 # Process as a regular road if the bridge is too small
-                self._log_debug(f"Skipping small bridge with area {bridge_area:.1f}m² (min size: {min_bridge_size}m²)")
+                self._log_debug("Skipping small bridge with area %.1fm² (min size: %sm²)", bridge_area, min_bridge_size)
                 self._process_linear_feature(
                     feature, 
                     features, 
                     transform,
-                    width_override=self.style_manager.get_default_layer_specs()['roads']['width'],
-                    additional_tags=[]
+                    width_override=self._road_specs['width']
                 )
 
     def _calculate_bridge_area(self, coords: List[List[float]]) -> float:
@@ -196,10 +206,10 @@ class RoadProcessor(LinearFeatureProcessor):
         # Calculate the length of the bridge (distance between first and last point)
         start_point = coords[0]
         end_point = coords[-1]
-        length = GeometryUtils().calculate_distance(start_point, end_point)
+        length = self.geometry.calculate_distance(start_point, end_point)
 
         # Calculate the width using the road width from config
-        width = self.style_manager.get_default_layer_specs()['roads']['width']
+        width = self._road_specs['width']
 
         # Approximate area as length * width
         return length * width
@@ -214,19 +224,18 @@ class RoadProcessor(LinearFeatureProcessor):
             transform: Coordinate transformation function
         """
         coords = self.geometry.extract_coordinates(feature)
-        if not coords:
+        if len(coords) < 3:  # Minimum points for a polygon
             return
 
-        transformed = [transform(lon, lat) for lon, lat in coords]
-        if len(transformed) >= 3:  # Minimum points for a polygon
-            features[self.feature_category].append({
-                "coords": transformed,
-                "type": "parking",
-                "is_parking": True,
-                "width": self.style_manager.get_default_layer_specs()['roads']['width']
-            })
-            
-            self._log_debug(f"Added parking area with {len(transformed)} points")
+        transformed = self._transform_coords(coords, transform)
+        features[self.feature_category].append({
+            "coords": transformed,
+            "type": "parking",
+            "is_parking": True,
+            "width": self._road_specs['width']
+        })
+        
+        self._log_debug("Added parking area with %d points", len(transformed))
 
     def is_parking_area(self, props: Dict[str, Any]) -> bool:
         """
@@ -238,29 +247,8 @@ class RoadProcessor(LinearFeatureProcessor):
         Returns:
             bool: True if the feature is a parking area
         """
-        return any(
-            props.get(key) in ["parking", "surface", "parking_aisle"]
-            for key in [Config.FEATURE_TYPES['AMENITY'], "parking", "service"]
-        )
-
-    def _is_tunnel(self, props: Dict[str, Any]) -> bool:
-        """
-        Check if the feature is a tunnel.
-        
-        Args:
-            props: Feature properties
-            
-        Returns:
-            bool: True if the feature is a tunnel
-        """
-        return props.get("tunnel") in ["yes", "true", "1"]
-
-    def _log_debug(self, message: str) -> None:
-        """
-        Wrapper for debug logging.
-        
-        Args:
-            message: Debug message to log
-        """
-        if self.debug:
-            print(message)
\ No newline at end of file
+        parking_values = self.PARKING_VALUES
+        for key in self.PARKING_KEYS:
+            if props.get(key) in parking_values:
+                return True
+        return False
@@ -1,3 +1,4 @@
+from shapely.geometry import Polygon
 from .base_processor import BaseProcessor
 
 class WaterProcessor(BaseProcessor):
@@ -5,17 +6,22 @@ class WaterProcessor(BaseProcessor):
         # Extract props and coords from the incoming `feature`
         props = feature.get("properties", {})
         coords = self.geometry.extract_coordinates(feature)
-        if not coords:
+        # Only features large enough to be considered water are kept
+        if len(coords) < 3:
             return
 
         # Apply the coordinate transform
-        transformed = [transform(lon, lat) for lon, lat in coords]
+        transformed = self._transform_coords(coords, transform)
 
-        # If it's large enough to be considered water
-        if len(transformed) >= 3:
-            features["water"].append({
-                "coords": transformed,
-                "type": props.get("water", "unknown")
-            })
-            if self.debug:
-                print(f"Added water feature with {len(transformed)} points")
+        try:
+            polygon = Polygon(transformed)
+        except ValueError:
+            # Closed ring with too few distinct points
+            polygon = None
+        features["water"].append({
+            "coords": transformed,
+            "type": props.get("water", "unknown"),
+            # Built once here and reused by bridge and barrier code
+            "polygon": polygon
+        })
+        self._log_debug("Added water feature with %d points", len(transformed))
@@ -1,29 +1,76 @@
 # lib/geometry.py
 from math import sqrt, sin, cos, pi, atan2, radians
+from itertools import chain
+import numpy as np
+import shapely
+
+
+class CoordinateTransformer:
+    """
+    Maps lon/lat coordinates onto the [0, size] model square.
+
+    Instances are called as ``transform(lon, lat)`` for a single point, and
+    ``transform_array(coords)`` transforms an (N, 2) array of points in one
+    NumPy operation.
+    """
+
+    def __init__(self, min_lon, max_lon, min_lat, max_lat, size):
+        self.min_lon = min_lon
+        self.max_lon = max_lon
+        self.min_lat = min_lat
+        self.max_lat = max_lat
+        self.size = size
+        # Spans are fixed per run; zero marks a degenerate axis
+        self.lon_span = max_lon - min_lon
+        self.lat_span = max_lat - min_lat
+
+    def __call__(self, lon, lat):
+        x = (lon - self.min_lon) / self.lon_span if self.lon_span else 0.5
+        y = (lat - self.min_lat) / self.lat_span if self.lat_span else 0.5
+        return [x * self.size, y * self.size]
+
+    def transform_array(self, coords):
+        """
+        Transform many points at once.
+
+        Args:
+            coords: Sequence or (N, 2) array of [lon, lat] pairs
+
+        Returns:
+            numpy.ndarray: (N, 2) float64 array of [x, y] model coordinates
+        """
+        arr = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        out = np.empty_like(arr)
+        if self.lon_span:
+            out[:, 0] = (arr[:, 0] - self.min_lon) / self.lon_span
+        else:
+            out[:, 0] = 0.5
+        if self.lat_span:
+            out[:, 1] = (arr[:, 1] - self.min_lat) / self.lat_span
+        else:
+            out[:, 1] = 0.5
+        out *= self.size
+        return out
 
 
 class GeometryUtils:
     def create_coordinate_transformer(self, features, size):
-        """Create a coordinate transformation function without border inset"""
+        """Create a coordinate transformer (see CoordinateTransformer) without border inset"""
         all_coords = []
         for feature in features:
             coords = self.extract_coordinates(feature)
             all_coords.extend(coords)
 
         if not all_coords:
-            return lambda lon, lat: [size / 2, size / 2]
-
-        # Calculate bounds
-        lons, lats = zip(*all_coords)
-        min_lon, max_lon = min(lons), max(lons)
-        min_lat, max_lat = min(lats), max(lats)
+            # Degenerate bounds map every point to the centre of the model
+            return CoordinateTransformer(0.0, 0.0, 0.0, 0.0, size)
 
-        def transform(lon, lat):
-            x = (lon - min_lon) / (max_lon - min_lon) if (max_lon != min_lon) else 0.5
-            y = (lat - min_lat) / (max_lat - min_lat) if (max_lat != min_lat) else 0.5
-            return [x * size, y * size]
+        # Calculate bounds in one pass over a (N, 2) array
+        arr = np.asarray(all_coords, dtype=np.float64)
+        min_lon, min_lat = arr.min(axis=0).tolist()
+        max_lon, max_lat = arr.max(axis=0).tolist()
 
-        return transform
+        return CoordinateTransformer(min_lon, max_lon, min_lat, max_lat, size)
 
     def extract_coordinates(self, feature):
         """Extract coordinates from GeoJSON feature"""
@@ -49,6 +96,51 @@ class GeometryUtils:
 
         return coords
 
+    def create_linestrings(self, coord_lists):
+        """
+        Build an array of LineStrings from a list of coordinate lists in a
+        single vectorized shapely call.
+
+        Args:
+            coord_lists: Sequence of coordinate lists, each with at least 2 points
+
+        Returns:
+            numpy.ndarray: Object array of shapely LineStrings, one per input
+        """
+        if not coord_lists:
+            return np.empty(0, dtype=object)
+        arrays = [np.asarray(coords, dtype=np.float64) for coords in coord_lists]
+        indices = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+        return shapely.linestrings(np.concatenate(arrays), indices=indices)
+
+    def create_polygons(self, coord_lists):
+        """
+        Build an array of Polygons from a list of exterior rings in a single
+        vectorized shapely call. Open rings are closed, as Polygon() does.
+
+        Args:
+            coord_lists: Sequence of coordinate lists
+
+        Returns:
+            numpy.ndarray: Object array with one Polygon per input, or None
+            where the ring has too few points to form a polygon
+        """
+        result = np.full(len(coord_lists), None, dtype=object)
+        arrays = []
+        keep = []
+        for i, coords in enumerate(coord_lists):
+            arr = np.asarray(coords, dtype=np.float64)
+            if len(arr) and not np.array_equal(arr[0], arr[-1]):
+                arr = np.vstack((arr, arr[:1]))
+            if len(arr) >= 4:
+                arrays.append(arr)
+                keep.append(i)
+        if arrays:
+            indices = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+            rings = shapely.linearrings(np.concatenate(arrays), indices=indices)
+            result[keep] = shapely.polygons(rings)
+        return result
+
     def calculate_centroid(self, points):
         """Calculate the centroid of a set of points"""
         x = sum(p[0] for p in points) / len(points)
@@ -57,10 +149,14 @@ class GeometryUtils:
 
     def calculate_distance(self, p1, p2):
         """Calculate distance between two points"""
-        return sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+        dx = p2[0] - p1[0]
+        dy = p2[1] - p1[1]
+        return sqrt(dx * dx + dy * dy)
 
     def calculate_polygon_area(self, points):
         """Calculate area using the shoelace formula on transformed coords"""
+        # Scalar on purpose: the building merger weights heights by this area,
+        # so the summation order is part of the SCAD output
         area = 0.0
         j = len(points) - 1
         for i in range(len(points)):
@@ -68,13 +164,28 @@ class GeometryUtils:
             j = i
         return abs(area) / 2.0
 
+    def format_points(self, points):
+        """
+        Format [x, y] points as an OpenSCAD point list with 3 decimals.
+
+        The whole list goes through one prebuilt %-template, so CPython
+        formats every value in a single call instead of one f-string per point.
+
+        Args:
+            points: Sequence of [x, y] pairs
+
+        Returns:
+            str: Points as "[x, y], [x, y], ..."
+        """
+        return ", ".join(["[%.3f, %.3f]"] * len(points)) % tuple(chain.from_iterable(points))
+
     def generate_polygon_points(self, points):
         """Generate polygon points string for OpenSCAD"""
         if len(points) < 3:
             return None
         if points[0] != points[-1]:
             points = points + [points[0]]
-        return ", ".join(f"[{p[0]:.3f}, {p[1]:.3f}]" for p in points)
+        return self.format_points(points)
 
     def generate_buffered_polygon(self, points, width):
         """Generate buffered polygon for linear features"""
@@ -83,30 +194,34 @@ class GeometryUtils:
 
         left_side = []
         right_side = []
+        # Halving is exact, so hoisting it leaves the offsets unchanged
+        half_width = width / 2
+        last = len(points) - 2
 
         for i in range(len(points) - 1):
-            p1, p2 = points[i], points[i + 1]
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
+            x1, y1 = points[i][0], points[i][1]
+            x2, y2 = points[i + 1][0], points[i + 1][1]
+            dx = x2 - x1
+            dy = y2 - y1
             length = sqrt(dx * dx + dy * dy)
             if length < 0.001:
                 continue
 
-            nx = -dy / length * width / 2
-            ny = dx / length * width / 2
+            nx = -dy / length * half_width
+            ny = dx / length * half_width
 
-            left_side.append([p1[0] + nx, p1[1] + ny])
-            right_side.append([p1[0] - nx, p1[1] - ny])
+            left_side.append([x1 + nx, y1 + ny])
+            right_side.append([x1 - nx, y1 - ny])
 
-            if i == len(points) - 2:  # Last segment
-                left_side.append([p2[0] + nx, p2[1] + ny])
-                right_side.append([p2[0] - nx, p2[1] - ny])
+            if i == last:  # Last segment
+                left_side.append([x2 + nx, y2 + ny])
+                right_side.append([x2 - nx, y2 - ny])
 
         if len(left_side) < 2:
             return None
 
         polygon_points = left_side + list(reversed(right_side))
-        return ", ".join(f"[{p[0]:.3f}, {p[1]:.3f}]" for p in polygon_points)
+        return self.format_points(polygon_points)
 
     def approximate_polygon_area_m2(self, coords):
         """Approximate the area of a lat/lon polygon in square meters"""
@@ -120,11 +235,12 @@ class GeometryUtils:
         lat_center = sum(lats) / len(lats)
 
         R = 6371000.0  # Earth radius in meters
+        cos_lat = cos(radians(lat_center))
 
         # Convert each coordinate to x, y relative to center
         xy_points = []
         for lon, lat in coords:
-            x = radians(lon - lon_center) * R * cos(radians(lat_center))
+            x = radians(lon - lon_center) * R * cos_lat
             y = radians(lat - lat_center) * R
             xy_points.append((x, y))
 
@@ -254,4 +370,4 @@ class GeometryUtils:
             final_points.append([p[0] - nx, p[1] - ny])
         
         # Format as polygon points string
-        return ", ".join(f"[{p[0]:.3f}, {p[1]:.3f}]" for p in final_points)
\ No newline at end of file
+        return self.format_points(final_points)
\ No newline at end of file
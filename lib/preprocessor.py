@@ -1,10 +1,15 @@
 # lib/preprocessor.py
 from copy import deepcopy
 import json
-import statistics
+import logging
+import sys
 from math import radians, cos, sin, sqrt, pi
+import numpy as np
+import shapely
 from shapely.geometry import shape, mapping, box, Point
 
+logger = logging.getLogger(__name__)
+
 
 class GeoJSONPreprocessor:
     def __init__(self, bbox=None, distance_meters=None):
@@ -28,15 +33,16 @@ class GeoJSONPreprocessor:
                 all_coords.extend(self.extract_coordinates(feature))
             if not all_coords:
                 raise ValueError("No coordinates found in features")
-            lons, lats = zip(*all_coords)
-            center_lon = statistics.median(lons)
-            center_lat = statistics.median(lats)
+            # Column-wise median over one (N, 2) array
+            coords = np.asarray(all_coords, dtype=np.float64)
+            center_lon, center_lat = np.median(coords[:, :2], axis=0).tolist()
             # Convert distance in meters to degrees (approximation)
             radius_degrees = self.distance / 111320.0
             cropping_geom = Point(center_lon, center_lat).buffer(radius_degrees)
             if self.debug:
-                print(
-                    f"Using circular cropping geometry with center: ({center_lon:.6f}, {center_lat:.6f}) and radius (deg): {radius_degrees:.6f}"
+                logger.debug(
+                    "Using circular cropping geometry with center: (%.6f, %.6f) and radius (deg): %.6f",
+                    center_lon, center_lat, radius_degrees,
                 )
             return cropping_geom
         elif self.bbox:
@@ -44,7 +50,7 @@ class GeoJSONPreprocessor:
             south, west, north, east = self.bbox
             cropping_geom = box(west, south, east, north)
             if self.debug:
-                print(f"Using bounding box cropping geometry: {self.bbox}")
+                logger.debug("Using bounding box cropping geometry: %s", self.bbox)
             return cropping_geom
         else:
             return None
@@ -80,7 +86,11 @@ class GeoJSONPreprocessor:
             geom = shape(feature["geometry"])
         except Exception as e:
             if self.debug:
-                print(f"Failed to parse geometry: {e}")
+                logger.debug("Failed to parse geometry: %s", e)
+            return None
+
+        # Cheap rejection before the overlay (fast when cropping_geom is prepared)
+        if not cropping_geom.intersects(geom):
             return None
 
         clipped = geom.intersection(cropping_geom)
@@ -103,9 +113,11 @@ class GeoJSONPreprocessor:
             ]
             clipped = max(polygons, key=lambda g: g.area) if polygons else valid_geoms[0]
 
-        new_feature = deepcopy(feature)
-        new_feature["geometry"] = mapping(clipped)
-        return new_feature
+        # Copy everything except the geometry, which is replaced anyway
+        return {
+            key: mapping(clipped) if key == "geometry" else deepcopy(value)
+            for key, value in feature.items()
+        }
 
     def process_geojson(self, input_data):
         """
@@ -117,6 +129,7 @@ class GeoJSONPreprocessor:
             raise ValueError(
                 "No cropping geometry defined (neither bbox nor distance provided)"
             )
+        shapely.prepare(cropping_geom)
 
         new_features = []
         for feature in features:
@@ -125,8 +138,8 @@ class GeoJSONPreprocessor:
                 new_features.append(cropped)
 
         if self.debug:
-            print(f"Original features: {len(features)}")
-            print(f"Cropped features: {len(new_features)}")
+            logger.debug("Original features: %d", len(features))
+            logger.debug("Cropped features: %d", len(new_features))
 
         output_data = {"type": "FeatureCollection", "features": new_features}
         return output_data
@@ -154,6 +167,12 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
     if not args.distance and not args.bbox:
         parser.error("Either --distance or --bbox must be specified")
 
@@ -1,11 +1,16 @@
 # lib/style/block_combiner.py
+import logging
 from math import sqrt
 import random
-from shapely.geometry import Polygon, MultiPolygon, LineString, box
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, LineString, box
 from shapely.ops import unary_union
 from shapely.validation import make_valid
 from ..geometry import GeometryUtils
 
+logger = logging.getLogger(__name__)
+
 class BlockCombiner:
     """
     Handles the combination of building footprints based on area thresholds and proximity.
@@ -122,33 +127,30 @@ class BlockCombiner:
         Returns:
             list: Footprint dictionaries with polygon, height, and area information
         """
-        footprints = []
+        # (feature, default height) for buildings, then industrial features
+        candidates = []
+        for category, default_height in (('buildings', 10.0), ('industrial', 15.0)):
+            for feat in features.get(category, []):
+                coords = feat.get('coords')
+                if coords and len(coords) >= 3:
+                    candidates.append((feat, default_height))
+        if not candidates:
+            return []
         
-        # Process normal building features
-        for bldg in features.get('buildings', []):
-            coords = bldg.get('coords')
-            if coords and len(coords) >= 3:
-                poly = Polygon(coords)
-                if poly.is_valid and not poly.is_empty:
-                    footprints.append({
-                        'polygon': poly,
-                        'height': bldg.get('height', 10.0),
-                        'area': poly.area,
-                        'original': bldg
-                    })
-        
-        # Process industrial features
-        for ind in features.get('industrial', []):
-            coords = ind.get('coords')
-            if coords and len(coords) >= 3:
-                poly = Polygon(coords)
-                if poly.is_valid and not poly.is_empty:
-                    footprints.append({
-                        'polygon': poly,
-                        'height': ind.get('height', 15.0),
-                        'area': poly.area,
-                        'original': ind
-                    })
+        # Build, validate and measure every footprint in batch
+        polys = self.geometry.create_polygons([feat['coords'] for feat, _ in candidates])
+        keep = shapely.is_valid(polys) & ~shapely.is_empty(polys)
+        areas = shapely.area(polys).tolist()
+        
+        footprints = []
+        for idx in np.flatnonzero(keep):
+            feat, default_height = candidates[idx]
+            footprints.append({
+                'polygon': polys[idx],
+                'height': feat.get('height', default_height),
+                'area': areas[idx],
+                'original': feat
+            })
         
         return footprints
 
@@ -253,7 +255,10 @@ class BlockCombiner:
             })
         
         if self.debug:
-            print(f"Area-based merge: {len(large_buildings)} large buildings, {len(merged_clusters)} merged clusters")
+            logger.debug(
+                "Area-based merge: %d large buildings, %d merged clusters",
+                len(large_buildings), len(merged_clusters)
+            )
             
         return large_buildings + merged_clusters
 
@@ -268,15 +273,15 @@ class BlockCombiner:
             list: Combined building features using legacy approach
         """
         if self.debug:
-            print("\n=== Legacy Block Combiner Debug ===")
+            logger.debug("\n=== Legacy Block Combiner Debug ===")
         
         building_footprints = self._gather_all_footprints(features)
         barrier_union = self._create_barrier_union(features)
         blocks = self._create_blocks_from_barriers(barrier_union)
         
         if self.debug:
-            print(f"Found {len(building_footprints)} building footprints")
-            print(f"Generated {len(blocks)} blocks from barrier union")
+            logger.debug("Found %d building footprints", len(building_footprints))
+            logger.debug("Generated %d blocks from barrier union", len(blocks))
         
         combined_buildings = []
         for block in blocks:
@@ -299,21 +304,21 @@ class BlockCombiner:
         Returns:
             shapely.geometry: Union of all barrier geometries
         """
-        barriers = []
-        
         road_width = self.style_manager.get_default_layer_specs()["roads"]["width"]
-        for road in features.get('roads', []):
-            try:
-                line = LineString(road["coords"])
-                buffered = line.buffer(road_width * 0.2)
-                if buffered.is_valid and not buffered.is_empty:
-                    barriers.append(buffered)
-            except Exception:
-                continue
+        # Build and buffer every road line in one batch
+        lines = self.geometry.create_linestrings([
+            road["coords"] for road in features.get('roads', [])
+            if len(road["coords"]) >= 2
+        ])
+        buffered = shapely.buffer(lines, road_width * 0.2)
+        barriers = list(buffered[shapely.is_valid(buffered) & ~shapely.is_empty(buffered)])
         
         for water in features.get('water', []):
             try:
-                poly = Polygon(water["coords"])
+                poly = water.get("polygon")
+                # WaterProcessor stores None when the ring could not form a polygon
+                if poly is None:
+                    continue
                 if poly.is_valid and not poly.is_empty:
                     barriers.append(poly.buffer(1.5))
             except Exception:
@@ -322,7 +327,7 @@ class BlockCombiner:
         if not barriers:
             return None
         
-        unioned = unary_union(barriers)
+        unioned = shapely.union_all(np.asarray(barriers, dtype=object))
         if not unioned.is_valid:
             unioned = make_valid(unioned)
         return unioned
@@ -385,7 +390,7 @@ class BlockCombiner:
             
         except Exception as e:
             if self.debug:
-                print(f"Error creating blocks: {e}")
+                logger.debug("Error creating blocks: %s", e)
             return []
 
     def _find_buildings_in_block(self, block, building_footprints):
@@ -28,7 +28,7 @@ class BuildingMerger:
         """Merge buildings based on distance."""
         merge_dist = self.style_manager.style["merge_distance"]
         if merge_dist <= 0:
-            return buildings
+            return list(buildings)
 
         indexed_buildings = self._index_buildings(buildings)
         visited = set()
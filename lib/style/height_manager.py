@@ -28,7 +28,19 @@ class HeightManager:
         Returns:
             float: Scaled height in millimeters
         """
-        height_m = self._extract_height(properties)
+        return self.scale_height_m(self._extract_height(properties), properties)
+
+    def scale_height_m(self, height_m: float, properties: Optional[Dict[str, Any]] = None) -> float:
+        """
+        Scale a height already known in meters with the current style settings.
+        
+        Args:
+            height_m: Height in meters
+            properties: Optional building properties for style modifiers
+            
+        Returns:
+            float: Scaled height in millimeters
+        """
         base_height = self._scale_to_range(height_m)
         
         # Apply any style-specific modifiers
@@ -45,11 +57,11 @@ class HeightManager:
             float: Extracted height in meters
         """
         # Try explicit height tag first
-        if "height" in properties:
+        height = properties.get("height")
+        if height is not None:
             try:
                 # Handle formats like "25 m", "25m", "25"
-                height_str = properties["height"].split()[0].strip('m')
-                return float(height_str)
+                return Config.parse_measurement(height, 'm')
             except (ValueError, IndexError):
                 pass
 
@@ -62,15 +74,15 @@ class HeightManager:
                 pass
 
         # Try min_height tag
-        if "min_height" in properties:
+        min_height = properties.get("min_height")
+        if min_height is not None:
             try:
-                min_height_str = properties["min_height"].split()[0].strip('m')
-                return float(min_height_str)
+                return Config.parse_measurement(min_height, 'm')
             except (ValueError, IndexError):
                 pass
 
         # Use default height based on building type
-        building_type = properties.get("building", "").lower()
+        building_type = Config.tag_value(properties, "building")
         if building_type in Config.INDUSTRIAL_BUILDINGS:
             return Config.INDUSTRIAL_SETTINGS["default_height"]
             
@@ -108,7 +120,7 @@ class HeightManager:
         
         Args:
             base_height: Base calculated height
-            properties: Building properties
+            properties: Building properties, or None
             
         Returns:
             float: Modified height in millimeters
@@ -132,7 +144,7 @@ class HeightManager:
             
         elif style == "block-combine":
             # Block combine: Heights based on cluster characteristics
-            if properties.get("is_cluster", False):
+            if properties and properties.get("is_cluster", False):
                 # Clustered buildings get a slight height bonus
                 return base_height * 1.2
             
@@ -1,4 +1,5 @@
 # lib/style/style_manager.py
+from itertools import chain
 from typing import Dict, Any, Optional
 from ..config import Config
 from .building_merger import BuildingMerger
@@ -67,12 +68,25 @@ class StyleManager:
         """
         return self.height_manager.scale_height(properties)
 
-    def merge_nearby_buildings(self, buildings: list, barrier_union=None) -> list:
+    def scale_building_height_m(self, height_m: float) -> float:
+        """
+        Scale a building height given in meters using HeightManager.
+        
+        Args:
+            height_m: Height in meters
+            
+        Returns:
+            Scaled height value
+        """
+        return self.height_manager.scale_height_m(height_m)
+
+    def merge_nearby_buildings(self, *building_lists: list, barrier_union=None) -> list:
         """
         Choose and execute building merging strategy based on style.
         
         Args:
-            buildings: List of building features
+            *building_lists: One or more lists of building features; they are
+                iterated in order without being concatenated into a new list
             barrier_union: Optional union of barrier geometries
             
         Returns:
@@ -81,8 +95,21 @@ class StyleManager:
         if self.style["artistic_style"] == "block-combine":
             return self.block_combiner.combine_buildings_by_block(self.current_features)
         else:
+            buildings = chain.from_iterable(building_lists)
             return self.building_merger.merge_buildings(buildings, barrier_union)
 
+    def uses_barrier_union(self) -> bool:
+        """
+        Check whether merge_nearby_buildings will read its barrier_union.
+        
+        Returns:
+            True if the distance-based merge is active
+        """
+        return (
+            self.style["artistic_style"] != "block-combine"
+            and self.style["merge_distance"] > 0
+        )
+
     def set_current_features(self, features: Dict[str, list]) -> None:
         """
         Store current features for reference by style components.
@@ -0,0 +1,22 @@
+# tests/test_bridge_processor.py
+import pytest
+
+from lib.feature_processor.bridge_processor import BridgeProcessor
+from lib.geometry import GeometryUtils
+from lib.style.style_manager import StyleManager
+
+
+@pytest.fixture
+def bridge_processor():
+    return BridgeProcessor(GeometryUtils(), StyleManager())
+
+
+@pytest.mark.parametrize("value", ["yes", "true", "1", True, 1])
+def test_is_bridge_accepts_truthy_values(bridge_processor, value):
+    assert bridge_processor._is_bridge({"bridge": value})
+
+
+@pytest.mark.parametrize("value", [None, "no", "false", "0", False, 0])
+def test_is_bridge_rejects_other_values(bridge_processor, value):
+    props = {} if value is None else {"bridge": value}
+    assert not bridge_processor._is_bridge(props)